@@ -4,7 +4,11 @@ from tkinter import messagebox
 import requests
 from datetime import datetime
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.backend_bases import MouseButton
+from matplotlib.colors import to_hex
+import numpy as np
 import seaborn as sns
 import csv
 import os
@@ -20,6 +24,321 @@ import gzip
 ctk.set_appearance_mode("System")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
+# Line colours for the city comparison chart (hex so Tk widgets can use them too).
+# The pale tab20 shades vanish on the light background, so light mode uses
+# tab10 plus the darker tab20b shades instead.
+COMPARISON_COLORS = {
+    "dark": [to_hex(color) for color in plt.get_cmap("tab20").colors],
+    "light": [to_hex(color) for color in plt.get_cmap("tab10").colors
+              + plt.get_cmap("tab20b").colors[0::4] + plt.get_cmap("tab20b").colors[1::4]],
+}
+
+
+def downsample_minmax(x, y, x0, x1, buckets):
+    """Reduce a sorted series to a min/max pair per bucket across [x0, x1].
+
+    One bucket per pixel column keeps every peak and trough visible while
+    drawing at most two points per column. The nearest point outside each
+    edge is always kept so lines run off the axes instead of stopping short.
+
+    >>> x = np.arange(1000.0)
+    >>> y = np.sin(x / 7.0)
+    >>> dx, dy = downsample_minmax(x, y, 100.0, 400.0, 50)
+    >>> bool(np.all(np.diff(dx) > 0)), len(dx) <= 2 * 50 + 2
+    (True, True)
+    >>> visible = y[100:401]
+    >>> visible.min() in dy, visible.max() in dy
+    (True, True)
+    >>> float(dx[0]), float(dx[-1])
+    (99.0, 401.0)
+    >>> downsample_minmax(x, y, 2000.0, 3000.0, 50)[0].tolist()
+    [999.0]
+
+    The edge neighbours never take the place of a visible extreme, even
+    when they are more extreme than their edge bucket:
+
+    >>> x = np.arange(10.0)
+    >>> y = np.array([0, 100, 50, 1, 2, 3, 4, 5, 6, 7.0])
+    >>> downsample_minmax(x, y, 0.5, 9.0, 3)[1].tolist()
+    [0.0, 100.0, 1.0, 2.0, 4.0, 5.0, 7.0]
+    """
+    first_in = np.searchsorted(x, x0, side="left")
+    stop_in = np.searchsorted(x, x1, side="right")
+    start = max(first_in - 1, 0)
+    stop = min(stop_in + 1, len(x))
+    if stop_in - first_in <= 2 * buckets or x1 <= x0:
+        return x[start:stop], y[start:stop]
+
+    # Bucket index of every visible point; x is sorted so each bucket is one run
+    inside_x, inside_y = x[first_in:stop_in], y[first_in:stop_in]
+    index = ((inside_x - x0) * (buckets / (x1 - x0))).astype(np.intp)
+    np.clip(index, 0, buckets - 1, out=index)
+
+    # Sorting by (bucket, y) puts each bucket's minimum first and maximum last
+    order = np.lexsort((inside_y, index))
+    last = np.flatnonzero(np.diff(index[order], append=buckets))
+    first = np.append(0, last[:-1] + 1)
+
+    # Sorted unique positions keep the original order of the points; the
+    # edge neighbours are added afterwards so they never win a bucket
+    inside = np.unique(np.concatenate((order[first], order[last]))) + first_in
+    keep = np.concatenate((np.arange(start, first_in), inside, np.arange(stop_in, stop)))
+    return x[keep], y[keep]
+
+
+class ComparisonCanvas(FigureCanvasTkAgg):
+    """Tk canvas that answers redraw requests with snapshot frames while dragging.
+
+    The toolbar asks for a full draw on every pan motion, which relabels
+    every tick and strokes every series and costs far more than a frame.
+    While the chart has a drag in progress, only the pixels inside the axes
+    are resampled instead. Ticks and lines catch up with one full draw when
+    the drag ends.
+    """
+
+    def __init__(self, figure, master, chart):
+        self.chart = chart
+        super().__init__(figure, master=master)
+
+    def draw_idle(self, *args, **kwargs):
+        if self.chart.drag is not None:
+            self.chart.drag_frame()
+        else:
+            super().draw_idle(*args, **kwargs)
+
+
+class ComparisonChart:
+    """Temperature chart overlaying many cities on one set of axes.
+
+    Series are animated artists drawn over a cached background (axes, ticks
+    and labels), so adding or removing a city only repaints the series
+    instead of the whole figure. Each series is downsampled to the pixel
+    width of the current view and only re-downsampled when the view changes.
+    While panning or zooming with the mouse, the plot area is resampled from
+    a snapshot instead, so a frame costs the same for any number of series.
+    """
+
+    def __init__(self, master, theme):
+        self.series = {}
+        self.background = None  # Figure without any series
+        self.composite = None  # Background with every series drawn on top
+        self.color_index = 0
+        self.drag = None  # Plot area snapshot while panning
+
+        self.fig = plt.Figure(figsize=(8, 6), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_title("City Temperature Comparison", fontsize=14, fontweight='bold')
+        self.ax.set_xlabel("Date & Time")
+        self.ax.set_ylabel("Temperature (°C)")
+        locator = mdates.AutoDateLocator()
+        self.ax.xaxis.set_major_locator(locator)
+        self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+        self.canvas = ComparisonCanvas(self.fig, master, self)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, master, pack_toolbar=False)
+        self.toolbar.update()
+        self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Every full draw (pan, zoom, resize) refreshes the cached background
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+        # Connected after the toolbar, so these run after its own pan handlers
+        self.canvas.mpl_connect("button_press_event", self.on_press)
+        self.canvas.mpl_connect("button_release_event", self.on_release)
+        self.canvas.mpl_connect("motion_notify_event", self.on_motion)
+        self.set_theme(theme)
+
+    def set_theme(self, theme):
+        """Restyle the figure and recolour every series for the theme."""
+        self.theme = theme
+        text_color = "white" if theme == "dark" else "black"
+
+        self.fig.patch.set_facecolor("#2b2b2b" if theme == "dark" else "#f0f0f0")
+        self.ax.title.set_color(text_color)
+        self.ax.xaxis.label.set_color(text_color)
+        self.ax.yaxis.label.set_color(text_color)
+        self.ax.tick_params(colors=text_color)
+
+        for entry in self.series.values():
+            entry["line"].set_color(self.color_for(entry["color_index"]))
+        self.canvas.draw_idle()
+
+    def color_for(self, index):
+        palette = COMPARISON_COLORS[self.theme]
+        return palette[index % len(palette)]
+
+    def set_series(self, name, x, y):
+        """Add a series, or replace its data if it is already plotted.
+
+        Returns the hex colour used for the series.
+        """
+        is_new = name not in self.series
+        if is_new:
+            line, = self.ax.plot([], [], color=self.color_for(self.color_index), linewidth=1.5, animated=True)
+            self.series[name] = {"line": line, "color_index": self.color_index}
+            self.color_index += 1
+
+        entry = self.series[name]
+        entry["x"] = x
+        entry["y"] = y
+        entry["bounds"] = [(x[0], y.min()), (x[-1], y.max())]
+        entry["view"] = None
+
+        if self.drag is not None:
+            # The cached background is from before the drag; the full draw
+            # when it ends picks the new data up
+            pass
+        elif self.autoscale():
+            self.canvas.draw_idle()
+        elif is_new:
+            self.paint(entry)
+        else:
+            # The old line is already in the composite, so start from the background
+            self.recompose()
+        return entry["line"].get_color()
+
+    def remove_series(self, name):
+        """Remove a series and redraw the others over the background."""
+        entry = self.series.pop(name, None)
+        if entry is None:
+            return
+        entry["line"].remove()
+
+        if self.drag is not None:
+            # Left to the full draw when the drag ends, as in set_series
+            pass
+        elif self.autoscale():
+            self.canvas.draw_idle()
+        else:
+            self.recompose()
+
+    def autoscale(self):
+        """Fit the view to every series; return True if the view moved.
+
+        Does nothing once the user has panned or zoomed, since the toolbar
+        turns autoscaling off.
+        """
+        if not self.ax.get_autoscale_on() or not self.series:
+            return False
+
+        limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        # Data limits come from the raw series, not the downsampled lines
+        self.ax.ignore_existing_data_limits = True
+        for entry in self.series.values():
+            self.ax.update_datalim(entry["bounds"])
+        self.ax.autoscale_view()
+        return (self.ax.get_xlim(), self.ax.get_ylim()) != limits
+
+    def draw_series(self, entry):
+        x0, x1 = self.ax.get_xlim()
+        view = (x0, x1, max(int(self.ax.bbox.width), 1))
+        # Only downsample again when the visible range or width has changed
+        if entry["view"] != view:
+            entry["line"].set_data(*downsample_minmax(entry["x"], entry["y"], *view))
+            entry["view"] = view
+        self.ax.draw_artist(entry["line"])
+
+    def on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for entry in self.series.values():
+            self.draw_series(entry)
+        self.composite = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def plot_area(self):
+        """Rows and columns of the renderer buffer inside the axes spines."""
+        height = self.canvas.get_renderer().height
+        x0, y0, x1, y1 = self.ax.bbox.extents
+        rows = slice(int(math.ceil(height - y1)) + 1, int(height - y0) - 1)
+        cols = slice(int(math.ceil(x0)) + 1, int(x1) - 1)
+        return rows, cols
+
+    def start_drag(self):
+        if self.composite is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.composite)
+
+        rows, cols = self.plot_area()
+        face = np.array(self.ax.get_facecolor()) * 255
+        self.drag = {
+            "image": np.asarray(self.canvas.buffer_rgba())[rows, cols].copy(),
+            "transform": self.ax.transData.frozen(),
+            "face": face.astype(np.uint8),
+        }
+
+    def drag_frame(self):
+        """Resample the snapshot to the current view and blit the axes."""
+        rows, cols = self.plot_area()
+        image = self.drag["image"]
+        height = self.canvas.get_renderer().height
+
+        # Pan and zoom are affine per axis, so map two display points from
+        # the current view back to where they were in the snapshot
+        mapping = self.ax.transData.inverted() + self.drag["transform"]
+        (bx, by), (x_one, y_one) = mapping.transform([(0, 0), (1, 1)])
+        scale_x, scale_y = x_one - bx, y_one - by
+
+        # Pixel centres of the plot area, in display coordinates
+        u = np.arange(cols.start, cols.stop) + 0.5
+        v = height - (np.arange(rows.start, rows.stop) + 0.5)
+        src_cols = np.rint(scale_x * u + bx - 0.5).astype(np.intp) - cols.start
+        src_rows = np.rint(height - (scale_y * v + by) - 0.5).astype(np.intp) - rows.start
+        valid_cols = (src_cols >= 0) & (src_cols < image.shape[1])
+        valid_rows = (src_rows >= 0) & (src_rows < image.shape[0])
+
+        frame = image[np.clip(src_rows, 0, image.shape[0] - 1)][:, np.clip(src_cols, 0, image.shape[1] - 1)]
+        # Areas dragged into view were never drawn, leave them empty
+        frame[~valid_rows] = self.drag["face"]
+        frame[:, ~valid_cols] = self.drag["face"]
+
+        np.asarray(self.canvas.buffer_rgba())[rows, cols] = frame
+        # The composite still shows the view from before the drag
+        self.composite = None
+        self.canvas.blit(self.ax.bbox)
+
+    def end_drag(self):
+        self.drag = None
+        self.canvas.draw_idle()
+
+    def on_press(self, event):
+        # Left drag pans and right drag zooms in the toolbar's pan mode
+        if (self.toolbar.mode == "pan/zoom" and event.inaxes is self.ax
+                and event.button in (MouseButton.LEFT, MouseButton.RIGHT)):
+            self.start_drag()
+
+    def on_release(self, event):
+        if self.drag is not None:
+            self.end_drag()
+
+    def on_motion(self, event):
+        # A button released outside the canvas never sends a release event
+        if self.drag is not None and not event.buttons:
+            self.end_drag()
+
+    def paint(self, entry):
+        """Draw a single new series over the cached composite."""
+        if self.composite is None:
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self.composite)
+        self.draw_series(entry)
+        self.composite = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.canvas.blit(self.fig.bbox)
+
+    def recompose(self):
+        """Redraw the remaining series over the cached background."""
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self.background)
+        for entry in self.series.values():
+            self.draw_series(entry)
+        self.composite = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.canvas.blit(self.fig.bbox)
+
+
 class ModernWeatherDashboard:
     def __init__(self, root):
         self.root = root
@@ -57,6 +376,13 @@ class ModernWeatherDashboard:
         self.weather_data = None
         self.selected_city = None
         
+        # City comparison, keyed by OpenWeatherMap city id. Every fetch of a
+        # compared city is merged in, so earlier readings stay as history
+        self.comparison_history = {}
+        self.comparison_window = None
+        self.comparison_chart = None
+        self.comparison_listbox = None
+        
         # Weather icons
         self.weather_icons = {
             "Clear": "☀️",
@@ -184,7 +510,17 @@ class ModernWeatherDashboard:
             height=40,
             command=self.export_to_csv
         )
-        self.export_button.pack(side=tk.LEFT)
+        self.export_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Compare button
+        self.compare_button = ctk.CTkButton(
+            self.search_frame, 
+            text="Add to Compare",
+            width=120,
+            height=40,
+            command=self.add_to_comparison
+        )
+        self.compare_button.pack(side=tk.LEFT)
         
         # Suggestions frame
         self.suggestions_frame = ctk.CTkFrame(self.content_frame)
@@ -291,12 +627,23 @@ class ModernWeatherDashboard:
             self.current_theme = "light"
             # Update listbox colors for light theme
             self.suggestions_listbox.configure(bg="#f0f0f0", fg="#000000")
+            if self.comparison_listbox is not None:
+                self.comparison_listbox.configure(bg="#f0f0f0")
         else:
             ctk.set_appearance_mode("dark")
             self.theme_button.configure(text="🌙 Dark")
             self.current_theme = "dark"
             # Update listbox colors for dark theme
             self.suggestions_listbox.configure(bg="#2b2b2b", fg="#ffffff")
+            if self.comparison_listbox is not None:
+                self.comparison_listbox.configure(bg="#2b2b2b")
+        
+        # Restyle the comparison chart and match its listbox to the new line colours
+        if self.comparison_chart is not None:
+            self.comparison_chart.set_theme(self.current_theme)
+            for index, city_id in enumerate(self.comparison_history):
+                color = self.comparison_chart.series[city_id]["line"].get_color()
+                self.comparison_listbox.itemconfig(index, fg=color)
     
     def create_placeholder(self):
         # Clear the plot container
@@ -426,6 +773,9 @@ class ModernWeatherDashboard:
             self.weather_data = data
             self.selected_city = city_name
             
+            # Keep cities already in the comparison up to date
+            self.root.after(0, lambda: self.update_comparison(data))
+            
             # Update UI in the main thread
             self.root.after(0, self.display_weather_info)
             self.root.after(0, self.visualize_weather)
@@ -548,12 +898,13 @@ class ModernWeatherDashboard:
             return
         
         # Extract data for visualization
-        dates, temps, humidities = [], [], []
+        dates, temps, humidities, icons = [], [], [], []
         for entry in self.weather_data["list"][:8]:  # Next 24 hours (8 data points, 3 hours apart)
             dt = datetime.fromtimestamp(entry["dt"])
             dates.append(dt)
             temps.append(entry["main"]["temp"])
             humidities.append(entry["main"]["humidity"])
+            icons.append(self.weather_icons.get(entry["weather"][0]["main"], "🌡️"))
         
         # Clear previous plot
         for widget in self.plot_container.winfo_children():
@@ -599,10 +950,9 @@ class ModernWeatherDashboard:
         ax.set_xticklabels([dt.strftime("%H:%M\n%d %b") for dt in dates], rotation=45, ha='right')
         
         # Add weather icons to x-axis labels
-        for i, date in enumerate(dates):
-            weather_main = self.weather_data["list"][i]["weather"][0]["main"]
-            icon = self.weather_icons.get(weather_main, "🌡️")
-            ax.annotate(icon, (date, min(temps)), textcoords="offset points", 
+        min_temp = min(temps)
+        for date, icon in zip(dates, icons):
+            ax.annotate(icon, (date, min_temp), textcoords="offset points", 
                         xytext=(0, -30), ha='center', fontsize=12)
         
         # Combine legends
@@ -627,6 +977,118 @@ class ModernWeatherDashboard:
             canvas_widget.update()
             time.sleep(0.03)
     
+    def add_to_comparison(self):
+        if not self.weather_data or not self.selected_city:
+            messagebox.showerror("Error", "No weather data to compare")
+            return
+        
+        city_id = self.merge_comparison_history(self.weather_data)
+        
+        if self.comparison_window is None:
+            self.open_comparison_window()
+        else:
+            self.plot_comparison_series(city_id)
+            self.comparison_window.lift()
+        
+        label = self.comparison_history[city_id]["label"]
+        self.status_bar.configure(text=f"Added {label} to comparison")
+    
+    def merge_comparison_history(self, data):
+        # Key on the API's city id so "london" and "London, GB" share a series
+        city = data["city"]
+        history = self.comparison_history.setdefault(
+            city["id"], {"label": f"{city['name']}, {city['country']}", "temps": {}}
+        )
+        
+        # Newer forecasts overwrite older ones for the same timestamp
+        for entry in data["list"]:
+            history["temps"][entry["dt"]] = entry["main"]["temp"]
+        return city["id"]
+    
+    def update_comparison(self, data):
+        city_id = data["city"]["id"]
+        if city_id not in self.comparison_history:
+            return
+        
+        self.merge_comparison_history(data)
+        if self.comparison_chart is not None:
+            self.plot_comparison_series(city_id)
+    
+    def open_comparison_window(self):
+        self.comparison_window = ctk.CTkToplevel(self.root)
+        self.comparison_window.title("City Comparison")
+        self.comparison_window.geometry("1100x700")
+        self.comparison_window.protocol("WM_DELETE_WINDOW", self.close_comparison_window)
+        
+        # Left column - compared cities
+        side_frame = ctk.CTkFrame(self.comparison_window)
+        side_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(10, 0), pady=10)
+        
+        ctk.CTkLabel(
+            side_frame, 
+            text="Cities", 
+            font=ctk.CTkFont(size=18, weight="bold"),
+            pady=10
+        ).pack(fill=tk.X, padx=15)
+        
+        # Entries are coloured like their lines, so the chart needs no legend
+        self.comparison_listbox = tk.Listbox(
+            side_frame,
+            width=25,
+            font=("Helvetica", 12),
+            activestyle="none",
+            bd=1,
+            bg="#2b2b2b" if self.current_theme == "dark" else "#f0f0f0",
+            selectbackground="#1f538d"
+        )
+        self.comparison_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        ctk.CTkButton(
+            side_frame,
+            text="Remove Selected",
+            command=self.remove_from_comparison
+        ).pack(fill=tk.X, padx=5, pady=(0, 5))
+        
+        # Right column - chart
+        plot_frame = ctk.CTkFrame(self.comparison_window)
+        plot_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        self.comparison_chart = ComparisonChart(plot_frame, self.current_theme)
+        
+        for city_id in self.comparison_history:
+            self.plot_comparison_series(city_id)
+    
+    def close_comparison_window(self):
+        self.comparison_window.destroy()
+        self.comparison_window = None
+        self.comparison_chart = None
+        self.comparison_listbox = None
+    
+    def plot_comparison_series(self, city_id):
+        history = self.comparison_history[city_id]
+        temps = history["temps"]
+        timestamps = sorted(temps)
+        x = mdates.date2num([datetime.fromtimestamp(dt) for dt in timestamps])
+        y = np.array([temps[dt] for dt in timestamps])
+        
+        # Listbox rows follow the order of comparison_history
+        is_new = city_id not in self.comparison_chart.series
+        color = self.comparison_chart.set_series(city_id, x, y)
+        if is_new:
+            self.comparison_listbox.insert(tk.END, history["label"])
+            self.comparison_listbox.itemconfig(tk.END, fg=color)
+    
+    def remove_from_comparison(self):
+        if not self.comparison_listbox.curselection():
+            return
+        
+        selected_idx = self.comparison_listbox.curselection()[0]
+        city_id = list(self.comparison_history)[selected_idx]
+        self.comparison_listbox.delete(selected_idx)
+        self.comparison_chart.remove_series(city_id)
+        label = self.comparison_history.pop(city_id)["label"]
+        self.status_bar.configure(text=f"Removed {label} from comparison")
+    
     def export_to_csv(self):
         if not self.weather_data or not self.selected_city:
             messagebox.showerror("Error", "No weather data to export")